@@ -0,0 +1,7 @@
+# orjson is an optional speedup (pip install awiki[speed]); both accept the raw response bytes
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+__all__ = ["loads"]
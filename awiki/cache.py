@@ -0,0 +1,44 @@
+import time
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    "A small in-process cache whose entries expire after a time-to-live, in seconds."
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Creates a new TTLCache instance.
+
+        Args:
+            maxsize (int): The maximum number of entries. When full, the oldest entry is evicted.
+            ttl (float): The default time-to-live of an entry. A value of 0 disables the cache.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value cached under `key`, or `default` if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Cache `value` under `key`, for `ttl` seconds if given (capped at the cache's own ttl)."""
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        if ttl <= 0:
+            return
+
+        if key not in self._entries and len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._entries.clear()
@@ -1,19 +1,79 @@
+import asyncio
 import datetime
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any, Self, TypeVar
+from urllib.parse import quote
 
-from httpx import AsyncClient
+from httpx import URL, AsyncClient, Limits, Response
 
-from awiki.constants import BASE_URL
+from awiki._json import loads
+from awiki.cache import TTLCache
+from awiki.constants import BASE_URL, CACHE_MAXSIZE, DEFAULT_LIMITS
 from awiki.models.enums import EventType, Language, Project
 from awiki.models.results import (
     FeaturedContent,
     File,
     OnThisDay,
     SearchPageResult,
+    SearchResults,
 )
 
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+def _json(response: Response) -> Any:
+    "Parses the raw body of a response, with orjson if it is installed."
+    return loads(response.content)
+
+
+# one parser per result type, built once rather than per request
+def _parse_search(response: Response) -> list[SearchPageResult]:
+    return SearchResults._from_bytes(response.content).pages
+
+
+def _parse_description(response: Response) -> str:
+    return _json(response)["description"]
+
+
+def _parse_file(response: Response) -> File:
+    return File._from_bytes(response.content)
+
+
+def _parse_featured_content(response: Response) -> FeaturedContent:
+    return FeaturedContent._from_bytes(response.content)
+
+
+def _parse_onthisday(response: Response) -> OnThisDay:
+    return OnThisDay._from_bytes(response.content)
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote(segment: str) -> str:
+    "Percent-encodes a URL path segment, including any slashes. Cached, since the same titles are often requested repeatedly."
+    return quote(segment, safe="")
+
+
+def _max_age(response: Response) -> float | None:
+    "Get the lifetime the server allows a response to be cached for, from its Cache-Control header."
+    for directive in response.headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-store", "no-cache"):
+            return 0
+        if name == "max-age" and value.isdigit():
+            return int(value)
+    return None
+
 
 class WikiClient:
-    """The main client through which to access the wrapper's functionality."""
+    """The main client through which to access the wrapper's functionality.
+
+    A client owns a pool of keep-alive connections, so create one at application startup and
+    share it, rather than creating one per request or inside a short-lived task. Release the pool
+    with `aclose()`, or use the client as an async context manager.
+    """
 
     def __init__(
         self,
@@ -21,6 +81,8 @@ class WikiClient:
         project: Project = Project.WIKIPEDIA,
         language: Language = Language.ENGLISH,
         proxy: str | None = None,
+        limits: Limits | None = None,
+        cache_ttl: float = 900,
     ) -> None:
         """Creates a new WikiClient instance.
 
@@ -30,8 +92,20 @@ class WikiClient:
             language (Language): The selected language for the client. This is not used in multilingual 
                                  projects, such as the Commons. Defaults to Language.ENGLISH.
             proxy (str):  The proxy to use for making requests. Defaults to None.
+            limits (Limits): Connection pool limits for the underlying HTTP client. Connections are kept 
+                             alive and reused across calls, and requests are multiplexed over HTTP/2.
+                             Defaults to constants.DEFAULT_LIMITS.
+            cache_ttl (float): How long, in seconds, responses are cached for. Repeated calls with the same 
+                               arguments return the cached result without a request. The server's 
+                               Cache-Control max-age is honored if it is shorter. 0 disables the cache. 
+                               Cached results are shared between callers, so do not mutate them; copy 
+                               a result first if you need to change it. Defaults to 900 (15 minutes).
         """
-        self._session = AsyncClient(proxy=proxy)
+        self._limits = limits or DEFAULT_LIMITS
+
+        self._session = AsyncClient(proxy=proxy, http2=True, limits=self._limits)
+
+        self._cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=cache_ttl)
 
         self._project = project
 
@@ -52,6 +126,7 @@ class WikiClient:
     def project(self, project: Project) -> None:
         """Set the selected Wikimedia project for the client."""
         self._project = project
+        self._rebind()
 
     @property
     def language(self) -> Language:
@@ -62,15 +137,76 @@ class WikiClient:
     def language(self, language: Language) -> None:
         """Set the selected language for the client."""
         self._language = language
+        self._rebind()
+
+    def _rebind(self) -> None:
+        "Recomputes the modules' URLs after the project or language changes."
+        self.core._rebind()
+        self.feed._rebind()
+
+    async def gather(self, *coros: Awaitable[Any]) -> list[Any]:
+        """
+        Runs the given awaitables concurrently over the client's connection pool.
+
+        Args:
+            *coros (Awaitable): The calls to run, e.g. `client.core.get_description("Python")`.
+
+        Returns:
+            list[Any]: The results, in the same order as the given awaitables.
+        """
+        return await asyncio.gather(*coros)
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP session and releases its connections."""
+        await self._session.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
 
 
 class _WikiModule:
     def __init__(self, client: WikiClient, base: str) -> None:
         self._client = client
         self._base_url = f"{BASE_URL}{base}"
+        self._rebind()
+
+    def _rebind(self) -> None:
+        "Precomputes the module's URLs from the client's project and language."
+
+    async def _get(self, url: URL | str, parse: Callable[[Response], T], params: dict[str, Any] | None = None) -> T:
+        "GETs `url` and parses the response with `parse`, through the client's response cache."
+        key = (url, tuple(params.items())) if params else url
+        result = self._client._cache.get(key, _MISSING)
+        if result is _MISSING:
+            response = await self._client._session.get(url, params=params)
+            if not response.is_success:
+                response.raise_for_status()
+            result = parse(response)
+            self._client._cache.set(key, result, ttl=_max_age(response))
+        return result
 
 
 class _Core(_WikiModule):
+    def _rebind(self) -> None:
+        root = f"{self._base_url}/{self._client._project.value}/{self._client._language.value}"
+        # fixed endpoints are parsed into URLs once, instead of by httpx on every request
+        self._search_urls = {
+            "page": URL(f"{root}/search/page"),
+            "title": URL(f"{root}/search/title"),
+        }
+        self._page_url = f"{root}/page/"
+        self._file_url = f"{self._base_url}/commons/file/File:"
+
+    async def _search(self, endpoint: str, query: str, limit: int) -> list[SearchPageResult]:
+        return await self._get(
+            self._search_urls[endpoint],
+            _parse_search,
+            params={"q": query, "limit": limit},
+        )
+
     async def search_content(self, query: str, /, *, limit: int = 10) -> list[SearchPageResult]:
         """
         Searches wiki pages for the given search terms, and returns matching pages. 
@@ -85,14 +221,7 @@ class _Core(_WikiModule):
         Returns:
             list[SearchPageResult]: A list of search results.
         """
-        response = await self._client._session.get(
-            f"{self._base_url}/{self._client._project.value}/{self._client._language.value}/search/page",
-            params={"q": query, "limit": limit},
-        )
-        response.raise_for_status()
-        return [
-            SearchPageResult._from_json(result) for result in response.json()["pages"]
-        ]
+        return await self._search("page", query, limit)
 
     async def search_titles(self, query: str, /, *, limit: int = 10) -> list[SearchPageResult]:
         """
@@ -109,15 +238,7 @@ class _Core(_WikiModule):
         Returns:
             list[SearchPageResult]: A list of search results.
         """
-        response = await self._client._session.get(
-            f"{self._base_url}/{self._client._project.value}/{self._client._language.value}/search/title",
-            params={"q": query, "limit": limit},
-        )
-        response.raise_for_status()
-
-        return [
-            SearchPageResult._from_json(result) for result in response.json()["pages"]
-        ]
+        return await self._search("title", query, limit)
     
     async def get_description(self, title: str) -> str:
         """
@@ -130,23 +251,48 @@ class _Core(_WikiModule):
         Path:
             GET /core/v1/{project}/{language}/page/{title}/description 
         """
-        
-        response = await self._client._session.get(
-            f"{self._base_url}/{self._client._project.value}/{self._client._language.value}/page/{title}/description",
+        return await self._get(
+            f"{self._page_url}{_quote(title)}/description",
+            _parse_description,
         )
-        response.raise_for_status()
-        return response.json()["description"]
+
+    async def get_descriptions(self, titles: list[str]) -> list[str]:
+        """
+        Returns the descriptions of many pages, fetched concurrently. 
+        At most `limits.max_connections` requests are in flight at once.
+
+        Args:
+            titles (list[str]): Wiki page titles with spaces replaced with underscores. These ARE case-sensitive.
+
+        Returns:
+            list[str]: The descriptions, in the same order as `titles`.
+        """
+        max_connections = self._client._limits.max_connections
+        if max_connections is None:
+            return await asyncio.gather(*(self.get_description(title) for title in titles))
+
+        semaphore = asyncio.Semaphore(max_connections)
+
+        async def bounded(title: str) -> str:
+            async with semaphore:
+                return await self.get_description(title)
+
+        return await asyncio.gather(*(bounded(title) for title in titles))
     
     async def get_file(self, filename: str) -> File:
-        response = await self._client._session.get(
-            f"{self._base_url}/commons/file/File:{filename}",
+        return await self._get(
+            f"{self._file_url}{_quote(filename)}",
+            _parse_file,
         )
-        response.raise_for_status()
-        return File._from_json(response.json())
 
 
 class _Feed(_WikiModule):
-    async def featured_content(self, date: datetime.date = datetime.date.today()) -> FeaturedContent:
+    def _rebind(self) -> None:
+        root = f"{self._base_url}/wikipedia/{self._client._language.value}"
+        self._featured_url = f"{root}/featured/"
+        self._onthisday_url = f"{root}/onthisday/"
+
+    async def featured_content(self, date: datetime.date | None = None) -> FeaturedContent:
         """
         Fetches the featured content for a given date.
 
@@ -158,16 +304,18 @@ class _Feed(_WikiModule):
         Path:
             GET /wikipedia/{language}/featured/{YYYY}/{MM}/{DD}
         """
+        if date is None:
+            date = datetime.date.today()
+
         fmt_date = date.strftime("%Y/%m/%d")
-        response = await self._client._session.get(
-            f"{self._base_url}/wikipedia/{self._client._language.value}/featured/{fmt_date}",
+        return await self._get(
+            f"{self._featured_url}{fmt_date}",
+            _parse_featured_content,
         )
-        response.raise_for_status()
-        return FeaturedContent._from_json(response.json())
 
     async def onthisday(
         self,
-        date: datetime.date = datetime.date.today(),
+        date: datetime.date | None = None,
         typ: EventType = EventType.ALL,
     ) -> OnThisDay:
         """
@@ -180,11 +328,13 @@ class _Feed(_WikiModule):
         Path:
             GET /wikipedia/{language}/onthisday/{typ}/{MM}/{DD}
         """
-        fmt_date = f"{str(date.month).rjust(2, '0')}/{str(date.day - 1).rjust(2, '0')}"
-        response = await self._client._session.get(
-            f"{self._base_url}/wikipedia/{self._client._language.value}/onthisday/{typ.value}/{fmt_date}",
+        if date is None:
+            date = datetime.date.today()
+
+        fmt_date = f"{date.month:02d}/{date.day - 1:02d}"
+        return await self._get(
+            f"{self._onthisday_url}{typ.value}/{fmt_date}",
+            _parse_onthisday,
             params={"type": typ.value},
         )
-        response.raise_for_status()
-        return OnThisDay._from_json(response.json())
     
\ No newline at end of file
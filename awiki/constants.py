@@ -1,4 +1,13 @@
 from types import NoneType
 
+from httpx import Limits
+
 BASE_URL: str = "https://api.wikimedia.org"
-PRIMITIVES: tuple[type] = (bool, str, int, float, NoneType)
+PRIMITIVES: frozenset[type] = frozenset({bool, str, int, float, NoneType})
+CACHE_MAXSIZE: int = 1024
+
+DEFAULT_LIMITS: Limits = Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
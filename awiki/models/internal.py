@@ -1,132 +1,357 @@
 import datetime
+import functools
+import linecache
 import logging
-from dataclasses import dataclass, field
 from enum import EnumMeta
 from types import NoneType, UnionType
-from typing import TYPE_CHECKING, Any, Never, TypeVar, get_args, get_origin
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Never,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
+from awiki._json import loads
 from awiki.constants import PRIMITIVES
 from awiki.models.enums import PlatformType
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+try:
+    from annotationlib import (
+        Format,
+        call_annotate_function,
+        get_annotate_from_class_namespace,
+    )
+except ImportError:  # Python < 3.14, where annotations are always in the class namespace
+    get_annotate_from_class_namespace = None
+
 PlatformT = TypeVar("PlatformT", bound=PlatformType)
 ModelT = TypeVar("ModelT", bound="InterfaceModel")
 
+_MISSING = object()
+_UNION_TYPES = (Union, UnionType)
+
+
+class ModelMeta(type):
+    """Gives every model `__slots__` for its fields, so instances have no `__dict__`.
+
+    Slots have to be in the class namespace before the class is created, which
+    `__init_subclass__` is too late for. Class-level defaults would shadow the
+    slots, so they are moved to `__field_defaults__` for the generated `__init__`.
+    """
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> type:
+        inherited = {
+            slot for base in bases for parent in base.__mro__ for slot in parent.__dict__.get("__slots__", ())
+        }
+        defaults = {}
+        for base in reversed(bases):
+            defaults.update(getattr(base, "__field_defaults__", {}))
+
+        slots = []
+        for m_name in _namespace_annotations(namespace):
+            if m_name.startswith("_"):
+                continue
+            if m_name in namespace:
+                defaults[m_name] = namespace.pop(m_name)
+            if m_name not in inherited:
+                slots.append(m_name)
+
+        namespace["__slots__"] = tuple(slots)
+        namespace["__field_defaults__"] = defaults
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+def _namespace_annotations(namespace: dict[str, Any]) -> dict[str, Any]:
+    "Get the annotations of a class namespace, which from Python 3.14 (PEP 649) hold a lazy annotate function."
+    if "__annotations__" in namespace:
+        return namespace["__annotations__"]
 
-@dataclass(kw_only=True)
-class InterfaceModel:
+    if get_annotate_from_class_namespace is not None:
+        annotate = get_annotate_from_class_namespace(namespace)
+        if annotate is not None:
+            # only the names are needed, so forward references are left unevaluated
+            return call_annotate_function(annotate, Format.FORWARDREF)
+
+    return {}
+
+
+class InterfaceModel(metaclass=ModelMeta):
     "Represents any object which is a model to the API's object"
 
-    __prefix_schema__: dict[str, str] = field(default_factory=lambda: {})
+    __prefix_schema__: ClassVar[dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # get_type_hints evaluates every annotation of the MRO, so resolve them once per class
+        cls.__model_annotations__ = get_annotations(cls)
+        cls.__model_fields__ = tuple(cls.__model_annotations__)
+        if "__init__" not in cls.__dict__:
+            cls.__init__ = _generate_init(cls)
+        # str() falls back to __repr__, so a hand-written __repr__ shows in both
+        if "__repr__" not in cls.__dict__:
+            cls.__repr__ = _generate_repr(cls)
 
-    def __init__(self, **kwargs: dict[str, Any]) -> None:
-        for k, v in kwargs.items():
-            setattr(self, k, v)  # hmm
+        # models with a hand-written _from_json (e.g. ImageStructure), and their subclasses, keep it
+        inherited = cls._from_json.__func__
+        if "_from_json" not in cls.__dict__ and (
+            inherited is InterfaceModel._from_json.__func__ or getattr(inherited, "__awiki_generated__", False)
+        ):
+            cls.__deserialize_plan__ = _build_plan(cls)
+            cls._from_json = classmethod(_generate_from_json(cls))
 
     @classmethod
     def _from_json(cls: ModelT, data: dict) -> ModelT:
-        logging.debug(
-            f"BEGIN DESERIALIZATION [cls {cls.__name__}] FROM [keys {list(data)}]"
-        )
-        
-        constructed = {}
-
-        for m_name, m_type in get_annotations(cls).items():
-            method: Callable = None
-
-            typ: type = m_type
-
-            primary_is_array = get_origin(typ) in (list, tuple)
-            primary_is_option = is_optional(typ)
-
-            if data.get(m_name) is None:
-                if primary_is_option:
-                    constructed[m_name] = None
-                    continue
-                else:
-                    raise ValueError(f"In attr {m_name} of {cls.__name__}, data received is None but expected structure {typ}.")
-
-            while typ != (extracted := extract_typing(typ)):
-                typ = extracted
-
-            # call the type directly to construct
-            if typ in PRIMITIVES or issubclass(typ.__class__, EnumMeta):
-                method = typ
-
-            # custom behavior in .deserialize
-            elif issubclass(typ, CustomDeserializer):
-                method = typ.deserialize
-
-            # another InterfaceModel
-            elif issubclass(typ, InterfaceModel):
-                method = typ._from_json
-
-            # other standard uses
-            elif issubclass(typ, datetime.datetime):
-                method = datetime.datetime.fromisoformat
-
-            elif issubclass(typ, datetime.date):
-                def method(string):
-                    return datetime.date(*map(int, string[:-1].split("-")))
-
-            else:
-                raise ValueError(
-                    f"unimplemented deserialization source: "
-                    f"{typ.__name__} ({typ.__class__}) in {cls.__name__} for attr {m_name}"
-                )
-            
-            value = data.get(m_name)
-
-            if value is None:
-                if primary_is_option:
-                    constructed[m_name] = None
-                    continue
-                else:
-                    raise ValueError(f"expected a value in {m_name} of {cls.__name__} of type {m_type}, got None.")
-            
-            if m_name in getattr(cls, "__prefix_schema__", {}):
-                value = cls.__prefix_schema__[m_name] + value
-                
-            if primary_is_array:
-                constructed[m_name] = [method(v) for v in value]
-            else:
-                constructed[m_name] = method(value)
-
-        logging.debug(
-            f"CONSTRUCTED [{cls.__name__}] FROM [{list(data.keys())}] TO [{list(constructed.keys())}"
-        )
-        return cls(**constructed)
-
-    def __str__(self) -> str:
-        return f"{self.__class__.__name__}({', '.join(f'{k}={v}' for k, v in self.__dict__.items())})"
-
-    def __repr__(self) -> str:
-        return self.__str__()
-
-
-def extract_typing(typed: Any, safe: bool = True) -> type:
-    try:
-        return get_args(typed)[0]
-    except (TypeError, IndexError) as e:
-        if safe:
-            return typed
-        raise TypeError(f"expected a typing object, got {typed}") from e
+        "Constructs the model from its JSON representation. Generated for each subclass on definition."
+        raise TypeError(f"{cls.__name__} is not a concrete model and cannot be deserialized")
+
+    @classmethod
+    def _from_bytes(cls: ModelT, raw: bytes) -> ModelT:
+        "Constructs the model from a raw JSON document, parsed with orjson if it is installed."
+        return cls._from_json(loads(raw))
+
 
 def is_optional(typed: Any) -> bool:
-    return get_origin(typed) is UnionType and NoneType in get_args(typed)
+    return get_origin(typed) in _UNION_TYPES and NoneType in get_args(typed)
 
 
 def get_annotations(cls: ModelT) -> dict[str, type]:
-    if not hasattr(cls, "__annotations__"):
-        return {}
-    annotations = cls.__annotations__.copy()
-    if hasattr(cls, "__mro__"):
-        for parent in cls.__mro__:
-            if hasattr(parent, "__annotations__"):
-                annotations.update(parent.__annotations__)
-    return {k:v for k, v in annotations.items() if not k.startswith("_")}
+    "Get the public field annotations of `cls` and its bases, with string (forward) references evaluated."
+    # the class is not bound in its module yet while it is being defined, so it may refer to itself
+    annotations = get_type_hints(cls, localns={cls.__name__: cls})
+    return {k: v for k, v in annotations.items() if not k.startswith("_")}
+
+
+class EnumLookup(dict):
+    "Maps the values of an enum to its members. Unknown values fall back to calling the enum, which raises ValueError."
+
+    def __init__(self, enum: EnumMeta) -> None:
+        super().__init__((member.value, member) for member in enum)
+        self.enum = enum
+
+    def __missing__(self, value: Any) -> Any:
+        return self.enum(value)
+
+
+@functools.cache
+def enum_lookup(enum: EnumMeta) -> EnumLookup:
+    "Get the shared value-to-member lookup of `enum`. Much cheaper than `enum(value)`, which runs the Enum call machinery."
+    return EnumLookup(enum)
+
+
+def _parse_date(string: str) -> datetime.date:
+    "Parses the API's 'YYYY-MM-DDZ' dates with the C implementation of date.fromisoformat."
+    return datetime.date.fromisoformat(string.removesuffix("Z"))
+
+
+# the deserializer of each resolved field type, filled in as models are defined
+_CONVERTERS: dict[type, "Callable"] = {
+    **{typ: typ for typ in PRIMITIVES},
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.date: _parse_date,
+}
+
+
+@functools.cache
+def _resolve_type(typed: Any) -> tuple[type, bool, bool]:
+    "Resolves an annotation to its innermost type, and whether it is optional and/or an array."
+    primary_is_option = is_optional(typed)
+    if primary_is_option:
+        typed = next(arg for arg in get_args(typed) if arg is not NoneType)
+
+    origin = get_origin(typed)
+    primary_is_array = origin in (list, tuple)
+    if primary_is_array:
+        typed = get_args(typed)[0]
+        origin = get_origin(typed)
+
+    # parameterized models (PlatformArticle[...]) deserialize as their origin
+    if origin is not None:
+        typed = origin
+
+    return typed, primary_is_option, primary_is_array
+
+
+def _resolve_field(cls: ModelT, m_name: str, m_type: Any) -> tuple["Callable", bool, bool]:
+    "Resolves the deserializer of a model field, and whether it is optional and/or an array."
+    typ, primary_is_option, primary_is_array = _resolve_type(m_type)
+
+    method = _CONVERTERS.get(typ)
+    if method is None:
+        method = _find_converter(cls, m_name, typ)
+        # a model referring to itself gets a deferred lookup, which is not shared
+        if typ is not cls:
+            _CONVERTERS[typ] = method
+
+    return method, primary_is_option, primary_is_array
+
+
+def _find_converter(cls: ModelT, m_name: str, typ: type) -> "Callable":
+    "Picks the deserializer of a resolved field type, for types not yet in `_CONVERTERS`."
+    # call the type directly to construct
+    if typ in PRIMITIVES:
+        return typ
+
+    # enum members are looked up by value in a plain dict
+    elif isinstance(typ, EnumMeta):
+        return enum_lookup(typ).__getitem__
+
+    # custom behavior in .deserialize
+    elif issubclass(typ, CustomDeserializer):
+        return typ.deserialize
+
+    # another InterfaceModel. a model referring to itself has no _from_json yet, so defer the lookup
+    elif issubclass(typ, InterfaceModel):
+        return typ._from_json if typ is not cls else lambda data: cls._from_json(data)
+
+    # other standard uses
+    elif issubclass(typ, datetime.datetime):
+        return datetime.datetime.fromisoformat
+
+    elif issubclass(typ, datetime.date):
+        return _parse_date
+
+    raise ValueError(
+        f"unimplemented deserialization source: "
+        f"{typ.__name__} ({typ.__class__}) in {cls.__name__} for attr {m_name}"
+    )
+
+
+def _build_plan(cls: ModelT) -> list[tuple[str, "Callable", bool, bool, str | None]]:
+    "Resolves every field of `cls` to a (name, deserializer, is_optional, is_array, prefix) entry."
+    unknown = cls.__prefix_schema__.keys() - cls.__model_annotations__.keys()
+    if unknown:
+        raise ValueError(f"__prefix_schema__ of {cls.__name__} names unknown fields: {sorted(unknown)}")
+
+    return [
+        (m_name, *_resolve_field(cls, m_name, m_type), cls.__prefix_schema__.get(m_name))
+        for m_name, m_type in cls.__model_annotations__.items()
+    ]
+
+
+def _generate_from_json(cls: ModelT) -> "Callable":
+    """Builds a `_from_json` specialized to the fields of `cls`.
+
+    The resolved `cls.__deserialize_plan__` is emitted as straight-line code,
+    so deserializing a payload does no typing reflection. The instance is created
+    with `object.__new__` and its slots are assigned directly, since every field is
+    known here, skipping the call to `__init__`.
+    """
+    annotations = cls.__model_annotations__
+    m_names = [m_name for m_name, *_ in cls.__deserialize_plan__]
+    namespace = {
+        "logging": logging,
+        "_debug_enabled": logging.root.isEnabledFor,
+        "_DEBUG": logging.DEBUG,
+        "_new": object.__new__,
+    }
+    # the debug messages are only built when debug logging is on
+    lines = [
+        "def _from_json(cls, data):",
+        "    debug = _debug_enabled(_DEBUG)",
+        "    if debug:",
+        '        logging.debug("BEGIN DESERIALIZATION [cls %s] FROM [keys %s]", cls.__name__, list(data))',
+        "    constructed = _new(cls)",
+    ]
+
+    for m_name, method, primary_is_option, primary_is_array, prefix in cls.__deserialize_plan__:
+        namespace[f"_convert_{m_name}"] = method
+
+        lines.append(f"    value = data.get({m_name!r})")
+        lines.append("    if value is None:")
+        if primary_is_option:
+            lines.append(f"        constructed.{m_name} = None")
+            lines.append("    else:")
+            indent = "        "
+        else:
+            # whether the key is absent or null is only worked out once the field has failed
+            head = f"In attr {m_name} of {cls.__name__}, data received is "
+            tail = f" but expected structure {annotations[m_name]}."
+            lines.append(
+                f"        raise ValueError({head!r} + ('missing' if {m_name!r} not in data else 'None') + {tail!r})"
+            )
+            indent = "    "
+
+        if prefix is not None:
+            lines.append(f"{indent}if not value.startswith({prefix!r}):")
+            lines.append(f"{indent}    value = {prefix!r} + value")
+
+        if primary_is_array:
+            lines.append(f"{indent}constructed.{m_name} = list(map(_convert_{m_name}, value))")
+        else:
+            lines.append(f"{indent}constructed.{m_name} = _convert_{m_name}(value)")
+
+    lines.append("    if debug:")
+    lines.append(
+        f'        logging.debug("CONSTRUCTED [%s] FROM [%s] TO [%s]", cls.__name__, list(data), {m_names!r})'
+    )
+    lines.append("    return constructed")
+
+    fn = _create_fn(cls, "_from_json", lines, namespace)
+    # marks the function as generated, so subclasses regenerate it for their own fields
+    fn.__awiki_generated__ = True
+    return fn
+
+
+def _generate_init(cls: ModelT) -> "Callable":
+    "Builds a keyword-only `__init__` which assigns each field of `cls` directly."
+    namespace = {}
+    params = []
+    body = []
+
+    for m_name in cls.__model_fields__:
+        default = cls.__field_defaults__.get(m_name, _MISSING)
+        if default is _MISSING:
+            params.append(m_name)
+        else:
+            namespace[f"_default_{m_name}"] = default
+            params.append(f"{m_name}=_default_{m_name}")
+        body.append(f"    self.{m_name} = {m_name}")
+
+    lines = [f"def __init__(self, *, {', '.join(params)}):" if params else "def __init__(self):"]
+    lines.extend(body or ["    pass"])
+    return _create_fn(cls, "__init__", lines, namespace)
+
+
+def _generate_repr(cls: ModelT) -> "Callable":
+    "Builds a `__repr__` which formats each field of `cls` by direct attribute access."
+    fields = ", ".join(f"{m_name}={{self.{m_name}}}" for m_name in cls.__model_fields__)
+    lines = [
+        "def __repr__(self):",
+        f'    return f"{cls.__name__}({fields})"',
+    ]
+    return _create_fn(cls, "__repr__", lines, {})
+
+
+def _create_fn(cls: ModelT, name: str, lines: list[str], namespace: dict[str, Any]) -> "Callable":
+    """Compiles the generated source `lines` and returns the function `name` defined by it.
+
+    As dataclasses does, the function is defined inside a factory taking `namespace`
+    as arguments, so the converters and defaults it uses are closure variables
+    rather than global lookups. The source is registered with `linecache` under a
+    per-class filename, so tracebacks and `inspect.getsource` show the generated code.
+    """
+    lines = [
+        f"def __create_fn__({', '.join(namespace)}):",
+        *(f"    {line}" for line in lines),
+        f"    return {name}",
+    ]
+    source = "\n".join(lines) + "\n"
+    filename = f"<awiki generated {cls.__module__}.{cls.__qualname__}.{name}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    factory_namespace = {}
+    exec(compile(source, filename, "exec"), {}, factory_namespace)
+    fn = factory_namespace["__create_fn__"](**namespace)
+    fn.__qualname__ = f"{cls.__qualname__}.{name}"
+    return fn
 
 
 class CustomDeserializer:
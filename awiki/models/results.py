@@ -2,7 +2,7 @@ import datetime
 from typing import Generic
 
 from awiki.models.enums import ArticleType, Language, LanguageDirection, MediaType, PlatformType
-from awiki.models.internal import InterfaceModel, PlatformT
+from awiki.models.internal import InterfaceModel, PlatformT, enum_lookup
 
 
 class BasicImage(InterfaceModel):
@@ -153,6 +153,12 @@ class SearchPageResult(InterfaceModel):
     "Reduced-size version of the page's lead image or None if no lead image exists"
     
 
+class SearchResults(InterfaceModel):
+    "Represents the response of the search endpoints"
+    pages: list[SearchPageResult]
+    "Matching pages"
+
+
 class ArticleTitles(InterfaceModel):
     canonical: str
     "Article title in URL-friendly format"
@@ -168,12 +174,8 @@ class ImageStructure(InterfaceModel):
 
     @classmethod
     def _from_json(cls: InterfaceModel, data: dict) -> InterfaceModel:
-        captions = {}
-
-        for lang, caption in data["captions"].items():
-            captions[Language(lang)] = caption
-
-        return cls(captions=captions)
+        languages = enum_lookup(Language)
+        return cls(captions={languages[lang]: caption for lang, caption in data["captions"].items()})
 
 
 class FullImage(InterfaceModel):
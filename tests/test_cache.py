@@ -0,0 +1,156 @@
+import unittest
+from unittest import mock
+
+import httpx
+
+from awiki import WikiClient
+from awiki.cache import TTLCache
+
+
+class FakeClock:
+    "Stands in for time.monotonic, advanced by hand."
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TTLCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = mock.patch("awiki.cache.time", mock.Mock(monotonic=self.clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hit_and_miss(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", "default"), "default")
+
+    def test_expiry(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        self.clock.now += 9.9
+        self.assertEqual(cache.get("a"), 1)
+        self.clock.now += 0.1
+        self.assertIsNone(cache.get("a"))
+
+    def test_ttl_is_capped(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("short", 1, ttl=5)
+        cache.set("long", 2, ttl=60)
+        self.clock.now += 5
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("long"), 2)
+        self.clock.now += 5
+        self.assertIsNone(cache.get("long"))
+
+    def test_zero_ttl_does_not_store(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1, ttl=0)
+        self.assertIsNone(cache.get("a"))
+
+        disabled = TTLCache(maxsize=4, ttl=0)
+        disabled.set("a", 1)
+        self.assertIsNone(disabled.get("a"))
+
+    def test_none_is_cached(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=10)
+        missing = object()
+        cache.set("a", None)
+        self.assertIsNone(cache.get("a", missing))
+
+    def test_evicts_oldest_at_maxsize(self) -> None:
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # replacing an existing key does not evict
+        cache.set("a", 3)
+        self.assertEqual(cache.get("b"), 2)
+
+        cache.set("c", 4)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.get("c"), 4)
+
+
+class ClientCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = mock.patch("awiki.cache.time", mock.Mock(monotonic=self.clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.requests = 0
+        self.description = "A programming language"
+        self.cache_control = None
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        headers = {"cache-control": self.cache_control} if self.cache_control else {}
+        return httpx.Response(200, json={"description": self.description}, headers=headers)
+
+    async def make_client(self, **kwargs) -> WikiClient:
+        client = WikiClient(**kwargs)
+        await client._session.aclose()
+        client._session = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        self.addAsyncCleanup(client.aclose)
+        return client
+
+    async def test_hit_and_miss(self) -> None:
+        client = await self.make_client(cache_ttl=60)
+        self.assertEqual(await client.core.get_description("Python"), self.description)
+        self.assertEqual(await client.core.get_description("Python"), self.description)
+        self.assertEqual(self.requests, 1)
+
+        await client.core.get_description("Rust")
+        self.assertEqual(self.requests, 2)
+
+    async def test_expiry(self) -> None:
+        client = await self.make_client(cache_ttl=60)
+        await client.core.get_description("Python")
+        self.clock.now += 60
+        await client.core.get_description("Python")
+        self.assertEqual(self.requests, 2)
+
+    async def test_shorter_max_age_wins(self) -> None:
+        self.cache_control = "public, max-age=5"
+        client = await self.make_client(cache_ttl=60)
+        await client.core.get_description("Python")
+        self.clock.now += 4
+        await client.core.get_description("Python")
+        self.assertEqual(self.requests, 1)
+
+        self.clock.now += 1
+        await client.core.get_description("Python")
+        self.assertEqual(self.requests, 2)
+
+    async def test_no_store_and_no_cache(self) -> None:
+        client = await self.make_client(cache_ttl=60)
+        for directive in ("no-store", "no-cache"):
+            self.requests = 0
+            self.cache_control = directive
+            await client.core.get_description(directive)
+            await client.core.get_description(directive)
+            self.assertEqual(self.requests, 2, directive)
+
+    async def test_zero_cache_ttl_disables_cache(self) -> None:
+        client = await self.make_client(cache_ttl=0)
+        await client.core.get_description("Python")
+        await client.core.get_description("Python")
+        self.assertEqual(self.requests, 2)
+
+    async def test_none_result_is_cached(self) -> None:
+        self.description = None
+        client = await self.make_client(cache_ttl=60)
+        self.assertIsNone(await client.core.get_description("Python"))
+        self.assertIsNone(await client.core.get_description("Python"))
+        self.assertEqual(self.requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()